@@ -6,23 +6,11 @@ and output a CSV in the same format as Jul_Aug 2025 Report.xlsx
 
 import pandas as pd
 import os
+import re
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-def remove_commas_from_number(value):
-    """Remove commas from number strings and convert to numeric"""
-    if pd.isna(value):
-        return None
-    if isinstance(value, str):
-        # Remove commas and convert to number
-        value = value.replace(',', '').strip()
-        if value == '' or value == '0':
-            return 0
-        try:
-            return float(value)
-        except:
-            return None
-    return value
-
 def parse_csv_file(file_path):
     """Parse a CSV file and return park names with their values for the current year (2025)"""
     df = pd.read_csv(file_path)
@@ -35,14 +23,19 @@ def parse_csv_file(file_path):
     # The 2025 value is typically in column 6 (index 6)
     value_col_idx = 6  # This should be the 2025 monthly value
     
-    result = {}
-    for idx, row in df.iterrows():
-        park_name = row[park_col]
-        if pd.notna(park_name) and park_name.strip() != '' and park_name != 'Park':
-            value = remove_commas_from_number(row.iloc[value_col_idx]) if len(row) > value_col_idx else 0
-            result[park_name] = value
+    # Read whole columns instead of boxing every row through iterrows
+    names = df[park_col].astype('string').str.strip()
+    mask = names.notna() & (names != '') & (names != 'Park')
+    
+    if len(df.columns) > value_col_idx:
+        # Remove commas and convert to numbers in one vectorized pass;
+        # cells that are blank once stripped count as zero
+        stripped = df.iloc[:, value_col_idx].astype(str).str.replace(',', '', regex=False).str.strip()
+        values = pd.to_numeric(stripped, errors='coerce').mask(stripped == '', 0)
+    else:
+        values = pd.Series(0, index=df.index)
     
-    return result
+    return dict(zip(names[mask], values[mask]))
 
 def main():
     # Base directory
@@ -55,7 +48,6 @@ def main():
     }
     
     # File mappings - maps CSV filename patterns to DataFrame column names
-    # Order matters! More specific patterns should come first
     file_mappings = {
         'non recreation visits': 'NonRecreationVisits',
         'non recreation hours': 'NonRecreationHours',
@@ -70,8 +62,14 @@ def main():
         'miscellaneous overnight stays': 'MiscellaneousOvernightStays'
     }
     
-    # Collect all data
-    all_data = []
+    # Match all patterns in one regex scan; longest alternatives come first
+    # so a specific pattern wins over a generic one at the same position
+    file_pattern = re.compile('|'.join(
+        re.escape(pattern) for pattern in sorted(file_mappings, key=len, reverse=True)))
+    
+    # Collect all data as column name -> list of values (one entry per row)
+    columns = defaultdict(list)
+    n_rows = 0
     
     for folder, month_info in months.items():
         folder_path = base_dir / folder
@@ -82,46 +80,56 @@ def main():
         
         print(f"Processing {folder}...")
         
-        # Initialize data dictionary for parks
-        month_data = {}
+        # Files to parse and the column each one fills
+        files = []
+        column_names = []
         
-        # Parse all CSV files in this folder
+        # Match all CSV files in this folder
         for file in folder_path.glob("*.csv"):
             file_name = file.stem.lower()
             
             # Find matching column name
-            column_name = None
-            for pattern, col in file_mappings.items():
-                if pattern in file_name:
-                    column_name = col
-                    break
+            match = file_pattern.search(file_name)
+            column_name = file_mappings[match.group(0)] if match else None
             
             if column_name is None:
                 print(f"  Skipping {file.name} - no matching column")
                 continue
             
             print(f"  Processing {file.name} -> {column_name}")
-            
-            # Parse the file
-            park_values = parse_csv_file(file)
-            
-            # Add values to month_data
-            for park, value in park_values.items():
-                if park not in month_data:
-                    # Initialize park entry
-                    month_data[park] = {
-                        'ParkName': park,
-                        'Year': month_info['year'],
-                        'Month': month_info['month']
-                    }
-                month_data[park][column_name] = value
+            files.append(file)
+            column_names.append(column_name)
+        
+        # Parse the files in parallel; pandas' CSV parser releases the GIL
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            results = list(executor.map(parse_csv_file, files))
         
-        # Convert to list of dictionaries
-        for park, data in month_data.items():
-            all_data.append(data)
+        # Initialize column name -> {park: value} for this month
+        month_values = {}
+        for column_name, park_values in zip(column_names, results):
+            month_values.setdefault(column_name, {}).update(park_values)
+        
+        # Every park seen in any file this month, in first-seen order
+        parks = list(dict.fromkeys(park for values in month_values.values() for park in values))
+        
+        columns['ParkName'].extend(parks)
+        columns['Year'].extend([month_info['year']] * len(parks))
+        columns['Month'].extend([month_info['month']] * len(parks))
+        
+        # Align each column with the parks, padding columns that were
+        # missing from earlier months
+        for column_name, park_values in month_values.items():
+            values = columns[column_name]
+            values.extend([None] * (n_rows - len(values)))
+            values.extend(park_values.get(park) for park in parks)
+        
+        n_rows += len(parks)
+    
+    for values in columns.values():
+        values.extend([None] * (n_rows - len(values)))
     
     # Create DataFrame
-    df = pd.DataFrame(all_data)
+    df = pd.DataFrame(columns)
     
     # Ensure all expected columns exist
     expected_columns = [
@@ -140,10 +148,9 @@ def main():
     df = df[expected_columns]
     
     # Sort by Month (January first, then February) and ParkName
-    month_order = {'January': 1, 'February': 2}
-    df['MonthOrder'] = df['Month'].map(month_order)
-    df = df.sort_values(['MonthOrder', 'ParkName'])
-    df = df.drop('MonthOrder', axis=1)
+    month_order = [month_info['month'] for month_info in months.values()]
+    df['Month'] = pd.Categorical(df['Month'], categories=month_order, ordered=True)
+    df = df.sort_values(['Month', 'ParkName'], kind='stable')
     
     # Save to CSV
     output_file = base_dir.parent / 'Jan_Feb_2025_Report.csv'